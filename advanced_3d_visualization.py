@@ -4,28 +4,145 @@ Professional-grade graphics using PyVista, Matplotlib, and Plotly
 Demonstrates complex 3D rendering, volumetric data, and interactive visualizations
 """
 
+import functools
+import os
+
 import numpy as np
+import numexpr as ne
+import matplotlib.colors as mcolors
 import pyvista as pv
 from pyvista import examples
 import plotly.graph_objects as go
 from scipy.spatial import Delaunay
-import colorsys
+from scipy.stats import qmc
+
+# EN: Working precision for all geometry and field arrays - VTK/OpenGL render in float32 anyway,
+#     so float64 would only double the memory traffic handed to VTK
+# DE: Arbeitsgenauigkeit für alle Geometrie- und Feld-Arrays - VTK/OpenGL rendern ohnehin in float32,
+#     float64 würde nur den an VTK übergebenen Speicherverkehr verdoppeln
+DTYPE = np.float32
+
+
+def diamond_square(size, roughness=0.7):
+    """EN: Diamond-square algorithm for procedural terrain generation
+       DE: Diamond-Square-Algorithmus für prozedurale Terraingenerierung"""
+    n = 2**size + 1  # Grid size must be 2^n + 1 / Gittergröße muss 2^n + 1 sein
+    terrain = np.empty((n, n), dtype=DTYPE)  # Every cell is written below / Jede Zelle wird unten beschrieben
+
+    # Initialize corners with random values / Ecken mit Zufallswerten initialisieren
+    terrain[0, 0] = np.random.standard_normal()
+    terrain[0, -1] = np.random.standard_normal()
+    terrain[-1, 0] = np.random.standard_normal()
+    terrain[-1, -1] = np.random.standard_normal()
+
+    step_size = n - 1
+    scale = 1.0  # Noise amplitude / Rauschamplitude
+
+    while step_size > 1:
+        half_step = step_size // 2
+
+        # EN: Diamond step - average square corners and add randomness (whole lattice at once)
+        # DE: Diamond-Schritt - Quadratecken mitteln und Zufälligkeit hinzufügen (gesamtes Gitter auf einmal)
+        corners = terrain[::step_size, ::step_size]
+        avg = (corners[:-1, :-1] + corners[:-1, 1:] +
+               corners[1:, :-1] + corners[1:, 1:]) / 4
+        terrain[half_step::step_size, half_step::step_size] = avg + np.random.standard_normal(avg.shape) * scale
+
+        # EN: Square step - zero padding plus a neighbour count handles the edges without branches
+        # DE: Square-Schritt - Null-Padding plus Nachbarzählung behandelt die Ränder ohne Verzweigungen
+        padded = np.pad(terrain, half_step)
+        for row0, col0 in ((0, half_step), (half_step, 0)):
+            rows = np.arange(row0, n, step_size)[:, None]
+            cols = np.arange(col0, n, step_size)[None, :]
+            total = (padded[rows, cols + half_step] + padded[rows + 2*half_step, cols + half_step] +
+                     padded[rows + half_step, cols] + padded[rows + half_step, cols + 2*half_step])
+            count = 4 - (rows == 0) - (rows == n-1) - (cols == 0) - (cols == n-1)
+            terrain[row0::step_size, col0::step_size] = total / count + np.random.standard_normal(total.shape) * scale
+
+        step_size = half_step
+        scale *= roughness
+
+    return terrain
+
+
+@functools.lru_cache(maxsize=1)
+def _load_brain():
+    """EN: Download/parse the example brain volume once per process and reuse it
+       DE: Lädt/parst das Beispiel-Gehirnvolumen einmal pro Prozess und verwendet es wieder"""
+    return examples.download_brain()
+
 
 class Professional3DGraphics:
     """High-end 3D graphics generator using professional visualization libraries"""
     
-    def __init__(self):
+    def __init__(self, off_screen=False, output_dir='output'):
         self.plotter = None
+        self._shown = False  # Shared plotter has been rendered once / Gemeinsamer Plotter wurde einmal gerendert
+        self.off_screen = off_screen  # Render to files instead of windows / In Dateien statt Fenster rendern
+        self.output_dir = output_dir
+        
+    def _output_path(self, filename):
+        """EN: Path for an off-screen render, creating the output directory on demand
+           DE: Pfad für ein Off-Screen-Rendering, legt das Ausgabeverzeichnis bei Bedarf an"""
+        os.makedirs(self.output_dir, exist_ok=True)
+        return os.path.join(self.output_dir, filename)
+        
+    def _get_plotter(self):
+        """EN: Shared plotter - the OpenGL context is created once and the scene is reset between demos
+           DE: Gemeinsamer Plotter - der OpenGL-Kontext entsteht einmal, die Szene wird zwischen Demos zurückgesetzt"""
+        if self.plotter is None:
+            self.plotter = pv.Plotter(window_size=[1920, 1080], off_screen=self.off_screen)
+        else:
+            self.plotter.clear()
+            self.plotter.remove_all_lights()
+            self.plotter.enable_lightkit()  # Default lighting of a fresh plotter / Standardbeleuchtung eines neuen Plotters
+            self.plotter.disable_anti_aliasing()
+            self.plotter.camera_set = False
+            # EN: A plotter that was already shown re-renders on every add_* call; hold that until _show
+            # DE: Ein bereits gezeigter Plotter rendert bei jedem add_*-Aufruf neu; das wird bis _show aufgeschoben
+            self.plotter.suppress_rendering = True
+        return self.plotter
+        
+    def close(self):
+        """EN: Release the shared plotter and its render window
+           DE: Gibt den gemeinsamen Plotter und sein Renderfenster frei"""
+        if self.plotter is not None:
+            self.plotter.close()
+            self.plotter = None
+            self._shown = False
+        
+    def _show(self, plotter, title, filename):
+        """EN: Open an interactive window, or render one frame straight to a PNG when off-screen
+           DE: Öffnet ein interaktives Fenster oder rendert off-screen ein Bild direkt als PNG"""
+        # EN: VTK only auto-fits the camera on a plotter's first render, so reused plotters do it here
+        # DE: VTK passt die Kamera nur beim ersten Rendern automatisch an, wiederverwendete Plotter tun es hier
+        if not plotter.camera_set:
+            plotter.view_isometric(render=False)
+        plotter.suppress_rendering = False
+        
+        if self.off_screen:
+            path = self._output_path(filename)
+            if self._shown:
+                # EN: Later frames skip show(), which would also read back and re-render for a depth image
+                # DE: Spätere Bilder umgehen show(), das zusätzlich für ein Tiefenbild zurückliest und neu rendert
+                plotter.render()
+                plotter.screenshot(path)
+            else:
+                plotter.show(title=title, screenshot=path, auto_close=False)
+            print(f"Saved {path}")
+        else:
+            plotter.show(title=title, auto_close=False)
+        self._shown = True
         
     def create_volumetric_brain_scan(self):
         """Create a professional medical-grade volumetric rendering"""
         print("Generating volumetric brain scan visualization...")
         
-        # Create plotter with professional settings
-        plotter = pv.Plotter(window_size=[1920, 1080], off_screen=False)
+        # Reuse the shared plotter with professional settings
+        plotter = self._get_plotter()
         
         # Load example brain data (high-resolution medical imaging)
-        volume = examples.download_brain()
+        volume = _load_brain()
         
         # Apply advanced volume rendering with opacity mapping
         # Sigmoid opacity creates smooth transparency transitions for better depth perception
@@ -48,13 +165,13 @@ class Professional3DGraphics:
         
         plotter.camera_position = 'xz'
         plotter.background_color = '#1a1a1a'
-        plotter.show(title="Volumetric Brain Scan - Medical Grade Rendering")
+        self._show(plotter, "Volumetric Brain Scan - Medical Grade Rendering", 'brain_scan.png')
         
     def create_parametric_surface(self):
         """Generate complex parametric surface with PBR materials"""
         print("Creating parametric surface with PBR materials...")
         
-        plotter = pv.Plotter(window_size=[1920, 1080])
+        plotter = self._get_plotter()
         
         # Create a complex parametric surface (Klein bottle)
         def klein_bottle(u, v):
@@ -62,37 +179,49 @@ class Professional3DGraphics:
             v = v * 2 * np.pi
             r = 4 * (1 - np.cos(u) / 2)
             
-            # EN: np.where performs vectorized conditionals - crucial for performance with large arrays
-            # DE: np.where führt vektorisierte Bedingungen aus - entscheidend für Performance bei großen Arrays
+            cos_u, sin_u, cos_v = np.cos(u), np.sin(u), np.cos(v)
+            
+            # EN: Shared terms are evaluated once; the branch-specific terms only on their own half,
+            #     instead of np.where computing both branches over every point
+            # DE: Gemeinsame Terme werden einmal berechnet, zweigspezifische nur auf ihrer eigenen Hälfte,
+            #     statt dass np.where beide Zweige über alle Punkte auswertet
             # Klein bottle parametric equations split at u=π for self-intersection handling
             # Klein-Flasche parametrische Gleichungen geteilt bei u=π für Selbstdurchdringung
-            x = np.where(
-                u < np.pi,
-                6 * np.cos(u) * (1 + np.sin(u)) + r * np.cos(u) * np.cos(v),
-                6 * np.cos(u) * (1 + np.sin(u)) + r * np.cos(v + np.pi)
-            )
+            lower = u < np.pi
+            upper = ~lower
             
-            y = np.where(
-                u < np.pi,
-                16 * np.sin(u) + r * np.sin(u) * np.cos(v),
-                16 * np.sin(u)
-            )
+            x = 6 * cos_u * (1 + sin_u)
+            x[lower] += r[lower] * cos_u[lower] * cos_v[lower]
+            x[upper] -= r[upper] * cos_v[upper]  # cos(v + π) = -cos(v)
+            
+            y = 16 * sin_u
+            y[lower] += r[lower] * sin_u[lower] * cos_v[lower]
             
             z = r * np.sin(v)
             return x, y, z
         
         # Generate mesh
-        u = np.linspace(0, 1, 200)
-        v = np.linspace(0, 1, 200)
+        u = np.linspace(0, 1, 200, dtype=DTYPE)
+        v = np.linspace(0, 1, 200, dtype=DTYPE)
         U, V = np.meshgrid(u, v)
         
         X, Y, Z = klein_bottle(U.flatten(), V.flatten())
         points = np.column_stack((X, Y, Z))
         
-        # EN: Delaunay triangulation creates optimal surface mesh from point cloud
-        # DE: Delaunay-Triangulation erstellt optimales Oberflächennetz aus Punktwolke
-        cloud = pv.PolyData(points)
-        surface = cloud.delaunay_2d()  # 2D Delaunay in parameter space / 2D Delaunay im Parameterraum
+        # EN: The (u, v) grid already defines the topology - split every grid quad into two triangles
+        #     by index arithmetic instead of re-triangulating the point cloud
+        # DE: Das (u, v)-Gitter legt die Topologie bereits fest - jedes Gitterviereck wird per
+        #     Indexarithmetik in zwei Dreiecke geteilt, statt die Punktwolke neu zu triangulieren
+        rows, cols = U.shape
+        idx = np.arange(rows * cols).reshape(rows, cols)
+        a, b = idx[:-1, :-1].ravel(), idx[1:, :-1].ravel()  # Quad corners / Viereckecken
+        c, d = idx[:-1, 1:].ravel(), idx[1:, 1:].ravel()
+        
+        faces = np.empty((2 * a.size, 4), dtype=np.int64)
+        faces[:, 0] = 3  # Points per face / Punkte pro Fläche
+        faces[0::2, 1:] = np.column_stack((a, b, c))
+        faces[1::2, 1:] = np.column_stack((b, d, c))
+        surface = pv.PolyData(points, faces.ravel())
         
         # Apply physically-based rendering
         plotter.add_mesh(
@@ -111,36 +240,59 @@ class Professional3DGraphics:
         
         plotter.background_color = '#0a0a0a'
         plotter.enable_anti_aliasing('ssaa')
-        plotter.show(title="Klein Bottle - Parametric Surface with PBR")
+        self._show(plotter, "Klein Bottle - Parametric Surface with PBR", 'klein_bottle.png')
         
     def create_fluid_dynamics_simulation(self):
         """Create a fluid dynamics visualization using streamlines"""
         print("Simulating fluid dynamics with streamlines...")
         
         # Generate vector field for fluid flow
-        x = np.arange(-10, 10, 0.5)
-        y = np.arange(-10, 10, 0.5)
-        z = np.arange(-5, 5, 0.5)
-        X, Y, Z = np.meshgrid(x, y, z)
-        
-        # Create complex vector field (simulating vortex flow)
+        # EN: Axes are broadcast as (z, y, x) so a C-order ravel walks x fastest, matching ImageData points
+        # DE: Achsen werden als (z, y, x) gebroadcastet, damit ein C-Order-Ravel wie ImageData x-schnellste läuft
+        spacing = 0.5
+        x = np.arange(-10, 10, spacing, dtype=DTYPE)
+        y = np.arange(-10, 10, spacing, dtype=DTYPE)
+        z = np.arange(-5, 5, spacing, dtype=DTYPE)
+        X = x[None, None, :]
+        Y = y[None, :, None]
+        Z = z[:, None, None]
+        
+        # Create complex vector field (simulating vortex flow); the radial terms stay a 2-D (y, x) plane
         r = np.sqrt(X**2 + Y**2)
         theta = np.arctan2(Y, X)
-        
-        U = -np.sin(theta) * np.exp(-r/10) - Z/20
-        V = np.cos(theta) * np.exp(-r/10) + X/30
-        W = np.sin(r/5) * np.cos(Z/3) * 0.5
-        
-        # Create grid
-        grid = pv.StructuredGrid(X, Y, Z)
-        grid['vectors'] = np.column_stack((U.flatten(), V.flatten(), W.flatten()))
+        decay = np.exp(-r/10)
+        
+        # EN: Components are written straight into one preallocated float32 (N, 3) buffer;
+        #     U, V, W are views onto its columns, so no column_stack copy is needed
+        # DE: Komponenten werden direkt in einen vorab angelegten float32-(N, 3)-Puffer geschrieben;
+        #     U, V, W sind Sichten auf dessen Spalten, daher entfällt die column_stack-Kopie
+        vectors = np.empty((z.size, y.size, x.size, 3), dtype=DTYPE)
+        U, V, W = np.moveaxis(vectors, -1, 0)
+        
+        np.multiply(-np.sin(theta), decay, out=U)
+        U -= Z/20
+        np.multiply(np.cos(theta), decay, out=V)
+        V += X/30
+        np.multiply(np.sin(r/5), np.cos(Z/3), out=W)
+        W *= 0.5
+        
+        # EN: Uniform grid - origin and spacing replace explicit per-point coordinates
+        # DE: Gleichmäßiges Gitter - Ursprung und Abstand ersetzen explizite Punktkoordinaten
+        grid = pv.ImageData(
+            dimensions=(x.size, y.size, z.size),
+            spacing=(spacing,) * 3,
+            origin=(x[0], y[0], z[0]),
+        )
+        grid['vectors'] = vectors.reshape(-1, 3)
         
         # Create streamlines
-        plotter = pv.Plotter(window_size=[1920, 1080])
+        plotter = self._get_plotter()
         
         # EN: Streamlines trace particle paths through vector field using numerical integration
         # DE: Stromlinien verfolgen Partikelpfade durch Vektorfeld mittels numerischer Integration
-        seed_points = pv.PolyData(np.random.uniform(-8, 8, (50, 3)))
+        # EN: Halton seeds cover the volume evenly, so half as many streamlines give the same coverage
+        # DE: Halton-Startpunkte decken das Volumen gleichmäßig ab, halb so viele Stromlinien genügen
+        seed_points = pv.PolyData(qmc.Halton(d=3).random(25) * 16 - 8)
         streamlines = grid.streamlines_from_source(
             seed_points,
             vectors='vectors',
@@ -148,11 +300,12 @@ class Professional3DGraphics:
             integration_direction='both'  # Forward and backward / Vorwärts und rückwärts
         )
         
-        # EN: Compute velocity magnitude from vector components using L2 norm
-        # DE: Berechnet Geschwindigkeitsbetrag aus Vektorkomponenten mit L2-Norm
-        streamlines['velocity'] = np.linalg.norm(
-            streamlines['vectors'], axis=1
-        )
+        # EN: Compute velocity magnitude from vector components using L2 norm (row-wise dot via einsum)
+        # DE: Berechnet Geschwindigkeitsbetrag aus Vektorkomponenten mit L2-Norm (zeilenweises Skalarprodukt per einsum)
+        velocity = streamlines['vectors']
+        streamlines['velocity'] = np.sqrt(
+            np.einsum('ij,ij->i', velocity, velocity)
+        ).astype(DTYPE, copy=False)
         
         plotter.add_mesh(
             streamlines.tube(radius=0.1),
@@ -176,50 +329,80 @@ class Professional3DGraphics:
         plotter.add_light(pv.Light(position=(30, 30, 30)))
         plotter.background_color = '#000000'
         plotter.enable_anti_aliasing('ssaa')
-        plotter.show(title="Fluid Dynamics - Vortex Flow Simulation")
+        self._show(plotter, "Fluid Dynamics - Vortex Flow Simulation", 'fluid_dynamics.png')
         
-    def create_quantum_visualization(self):
-        """Visualize quantum probability density using isosurfaces"""
+    def create_quantum_visualization(self, resolution=96):
+        """Visualize quantum probability density using isosurfaces on a resolution³ grid"""
         print("Creating quantum orbital visualization...")
         
         # Create hydrogen orbital probability density
         n, l, m = 4, 2, 0  # 4d orbital
         
-        # Create grid
-        x = np.linspace(-20, 20, 150)
-        y = np.linspace(-20, 20, 150)
-        z = np.linspace(-20, 20, 150)
-        X, Y, Z = np.meshgrid(x, y, z)
-        
+        # EN: One 1-D float32 axis, broadcast along x/y/z, so no full X/Y/Z meshgrid is ever allocated;
+        #     the same axis also defines the grid geometry below
+        # DE: Eine 1-D-float32-Achse, entlang x/y/z gebroadcastet, daher wird nie ein volles X/Y/Z-Meshgrid
+        #     angelegt; dieselbe Achse legt auch die Gittergeometrie unten fest
+        axis = np.linspace(-20, 20, resolution, dtype=DTYPE)
+        x = axis[:, None, None]
+        y = axis[None, :, None]
+        z = axis[None, None, :]
+
         # EN: Convert Cartesian to spherical coordinates for quantum wavefunction calculation
         # DE: Wandelt kartesische in sphärische Koordinaten für Quantenwellenfunktion-Berechnung um
-        r = np.sqrt(X**2 + Y**2 + Z**2)
-        theta = np.arccos(np.clip(Z / (r + 1e-10), -1, 1))  # Clip prevents arccos domain errors / Verhindert arccos-Bereichsfehler
-        phi = np.arctan2(Y, X)
-        
-        # EN: Simplified hydrogen wavefunction (real orbitals use Laguerre/Legendre polynomials)
-        # DE: Vereinfachte Wasserstoff-Wellenfunktion (echte Orbitale nutzen Laguerre/Legendre-Polynome)
-        R = (r**(l)) * np.exp(-r/(2*n)) * np.cos(m * phi)  # Radial part / Radialer Teil
-        Y_lm = np.sin(theta)**abs(m) * np.cos(l * theta)  # Angular part / Winkelabhängiger Teil
-        psi = R * Y_lm  # Complete wavefunction / Vollständige Wellenfunktion
-        
-        # Probability density
-        prob = np.abs(psi)**2
-        
-        # Create volume
-        grid = pv.StructuredGrid(X, Y, Z)
-        grid['probability'] = prob.flatten()
+        r = x*x + y*y + z*z  # First full-size array / Erstes Array in voller Größe
+        np.sqrt(r, out=r)
+        rho = np.sqrt(x*x + y*y)  # Cylindrical radius, 2-D / Zylinderradius, 2-D
+        theta = np.arctan2(rho, z)  # Robust at r=0 without clip/epsilon / Robust bei r=0 ohne Clip/Epsilon
+        phi = np.arctan2(y, x)  # Constant along z, stays 2-D / Konstant entlang z, bleibt 2-D
+
+        # EN: Simplified hydrogen wavefunction (real orbitals use Laguerre/Legendre polynomials),
+        #     radial part R = r^l·e^(-r/2n)·cos(mφ) times angular part Y_lm = sin(θ)^|m|·cos(lθ).
+        #     numexpr fuses the whole chain and |psi|² into one blocked, multi-threaded pass.
+        # DE: Vereinfachte Wasserstoff-Wellenfunktion (echte Orbitale nutzen Laguerre/Legendre-Polynome),
+        #     radialer Teil mal winkelabhängiger Teil; numexpr fasst die Kette und |psi|² in einem
+        #     blockweisen, mehrfädigen Durchlauf zusammen.
+        prob = ne.evaluate(
+            "(r**l * exp(-r/(2*n)) * cos(m*phi) * sin(theta)**abs_m * cos(l*theta))**2",
+            local_dict={'r': r, 'theta': theta, 'phi': phi, 'n': n, 'l': l, 'm': m, 'abs_m': abs(m)},
+        )
+
+        # EN: A uniform ImageData grid (required by the flying-edges contour below) orders points x-fastest,
+        #     hence the Fortran-order ravel
+        # DE: Ein gleichmäßiges ImageData-Gitter (vom Flying-Edges-Konturfilter unten benötigt) ordnet
+        #     Punkte x-schnellste, daher Fortran-Reihenfolge
+        grid = pv.ImageData(
+            dimensions=(axis.size,) * 3,
+            spacing=(float(axis[1] - axis[0]),) * 3,
+            origin=(float(axis[0]),) * 3,
+        )
+        grid['probability'] = prob.astype(DTYPE, copy=False).ravel(order='F')
         
-        plotter = pv.Plotter(window_size=[1920, 1080])
+        plotter = self._get_plotter()
         
         # EN: Create nested isosurfaces at 70th, 80th, 90th percentiles to show probability shells
         # DE: Erstellt verschachtelte Isoflächen bei 70., 80., 90. Perzentil für Wahrscheinlichkeitsschalen
         levels = np.percentile(prob[prob > 0], [70, 80, 90])
         
+        # EN: One flying-edges sweep (vtkFlyingEdges3D, a cache-friendly, multi-threaded successor to
+        #     marching cubes) extracts all shells; each output point carries its isovalue, so the shells
+        #     are split apart again by the level they are closest to
+        # DE: Ein Flying-Edges-Durchlauf (vtkFlyingEdges3D, cache-freundlicher, mehrfädiger Nachfolger von
+        #     Marching Cubes) erzeugt alle Schalen; jeder Ausgabepunkt trägt seinen Isowert, daher werden
+        #     die Schalen anhand des nächstgelegenen Niveaus wieder getrennt
+        contours = grid.contour(levels, scalars='probability', method='flying_edges')
+        shell_ids = np.abs(contours['probability'][:, None] - levels).argmin(axis=1)
+        
+        # HSV to RGB color mapping for all shells at once / HSV zu RGB Farbzuordnung für alle Schalen auf einmal
+        shell_colors = mcolors.hsv_to_rgb(np.column_stack((
+            np.arange(len(levels)) * 0.15,
+            np.full(len(levels), 0.8),
+            np.ones(len(levels)),
+        )))
+        
         for i, level in enumerate(levels):
-            contour = grid.contour([level], scalars='probability')  # Marching cubes algorithm / Marching-Cubes-Algorithmus
+            contour = contours.extract_points(shell_ids == i, adjacent_cells=False).extract_surface()
             opacity = 0.3 + (i * 0.2)  # Increasing opacity for inner shells / Steigende Transparenz für innere Schalen
-            color = colorsys.hsv_to_rgb(i * 0.15, 0.8, 1.0)  # HSV to RGB color mapping / HSV zu RGB Farbzuordnung
+            color = shell_colors[i]
             
             plotter.add_mesh(
                 contour,
@@ -239,7 +422,7 @@ class Professional3DGraphics:
         plotter.add_light(pv.Light(position=(-40, -40, 40), intensity=0.4))
         plotter.background_color = '#000000'
         plotter.enable_anti_aliasing('ssaa')
-        plotter.show(title="Quantum Orbital - Electron Probability Density")
+        self._show(plotter, "Quantum Orbital - Electron Probability Density", 'quantum_orbital.png')
         
     def create_interactive_neural_network(self):
         """Create an interactive 3D neural network visualization with Plotly"""
@@ -249,52 +432,59 @@ class Professional3DGraphics:
         layers = [8, 16, 32, 16, 4]
         
         # Generate node positions
-        nodes_x, nodes_y, nodes_z = [], [], []
-        node_colors = []
-        node_sizes = []
+        # EN: Node coordinates live in one preallocated (N, 3) array; each layer fills its slice as a ring
+        # DE: Knotenkoordinaten liegen in einem vorab angelegten (N, 3)-Array; jede Schicht füllt ihren Abschnitt als Ring
+        layer_offsets = np.concatenate(([0], np.cumsum(layers)))
+        nodes = np.empty((layer_offsets[-1], 3))
         
         for layer_idx, num_nodes in enumerate(layers):
-            x = layer_idx * 3
-            angle_step = 2 * np.pi / num_nodes
+            start, stop = layer_offsets[layer_idx], layer_offsets[layer_idx + 1]
+            angles = np.arange(num_nodes) * (2 * np.pi / num_nodes)
             radius = num_nodes * 0.3
             
-            for node_idx in range(num_nodes):
-                angle = node_idx * angle_step
-                y = radius * np.cos(angle)
-                z = radius * np.sin(angle)
-                
-                nodes_x.append(x)
-                nodes_y.append(y)
-                nodes_z.append(z)
-                
-                # Color based on layer
-                hue = layer_idx / len(layers)
-                color = colorsys.hsv_to_rgb(hue, 0.8, 1.0)
-                node_colors.append(f'rgb({int(color[0]*255)}, {int(color[1]*255)}, {int(color[2]*255)})')
-                node_sizes.append(8 + layer_idx * 2)
+            nodes[start:stop, 0] = layer_idx * 3
+            nodes[start:stop, 1] = radius * np.cos(angles)
+            nodes[start:stop, 2] = radius * np.sin(angles)
+        
+        # Color and size based on layer (one vectorized HSV to RGB conversion, one color string per layer)
+        num_layers = len(layers)
+        layer_hsv = np.column_stack((
+            np.arange(num_layers) / num_layers,
+            np.full(num_layers, 0.8),
+            np.ones(num_layers),
+        ))
+        layer_rgb = (mcolors.hsv_to_rgb(layer_hsv) * 255).astype(int)
+        layer_colors = np.array([f'rgb({r}, {g}, {b})' for r, g, b in layer_rgb])
+        
+        node_layers = np.repeat(np.arange(num_layers), layers)
+        node_colors = layer_colors[node_layers].tolist()
+        node_sizes = 8 + node_layers * 2
         
         # Generate connections
-        edge_x, edge_y, edge_z = [], [], []
+        # EN: Each node links to every node of the next layer; np.repeat/np.tile enumerate all pairs at
+        #     once and the NaN row closing each segment tells Plotly to break the line
+        # DE: Jeder Knoten verbindet sich mit jedem Knoten der nächsten Schicht; np.repeat/np.tile zählen
+        #     alle Paare auf einmal auf und die NaN-Zeile am Ende jedes Segments unterbricht die Plotly-Linie
+        segments = []
         node_idx = 0
         
-        for layer_idx in range(len(layers) - 1):
-            current_layer_size = layers[layer_idx]
-            next_layer_size = layers[layer_idx + 1]
+        for current_layer_size, next_layer_size in zip(layers[:-1], layers[1:]):
+            next_idx = node_idx + current_layer_size
+            current_nodes = nodes[node_idx:next_idx]
+            next_nodes = nodes[next_idx:next_idx + next_layer_size]
             
-            for i in range(current_layer_size):
-                for j in range(next_layer_size):
-                    current_node = node_idx + i
-                    next_node = node_idx + current_layer_size + j
-                    
-                    edge_x.extend([nodes_x[current_node], nodes_x[next_node], None])
-                    edge_y.extend([nodes_y[current_node], nodes_y[next_node], None])
-                    edge_z.extend([nodes_z[current_node], nodes_z[next_node], None])
+            segment = np.full((current_layer_size * next_layer_size, 3, 3), np.nan)
+            segment[:, 0] = np.repeat(current_nodes, next_layer_size, axis=0)
+            segment[:, 1] = np.tile(next_nodes, (current_layer_size, 1))
+            segments.append(segment.reshape(-1, 3))
             
-            node_idx += current_layer_size
+            node_idx = next_idx
+        
+        edges = np.concatenate(segments)
         
         # Create edge trace
         edge_trace = go.Scatter3d(
-            x=edge_x, y=edge_y, z=edge_z,
+            x=edges[:, 0], y=edges[:, 1], z=edges[:, 2],
             mode='lines',
             line=dict(color='rgba(100, 100, 255, 0.15)', width=1),
             hoverinfo='none',
@@ -303,7 +493,7 @@ class Professional3DGraphics:
         
         # Create node trace
         node_trace = go.Scatter3d(
-            x=nodes_x, y=nodes_y, z=nodes_z,
+            x=nodes[:, 0], y=nodes[:, 1], z=nodes[:, 2],
             mode='markers',
             marker=dict(
                 size=node_sizes,
@@ -311,7 +501,7 @@ class Professional3DGraphics:
                 line=dict(color='white', width=0.5),
                 opacity=0.9
             ),
-            text=[f'Layer {i//sum(1 for _ in layers)}, Node {i%10}' for i in range(len(nodes_x))],
+            text=[f'Layer {i//sum(1 for _ in layers)}, Node {i%10}' for i in range(len(nodes))],
             hoverinfo='text',
             name='Neurons'
         )
@@ -337,70 +527,25 @@ class Professional3DGraphics:
             height=1080,
         )
         
-        fig.show()
+        # EN: Plotly renders in the browser, so the off-screen equivalent is a standalone HTML file
+        # DE: Plotly rendert im Browser, das Off-Screen-Gegenstück ist daher eine eigenständige HTML-Datei
+        if self.off_screen:
+            path = self._output_path('neural_network.html')
+            fig.write_html(path)
+            print(f"Saved {path}")
+        else:
+            fig.show()
         
     def create_fractal_landscape(self):
         """Generate a stunning fractal landscape with advanced lighting"""
         print("Generating fractal terrain landscape...")
         
-        def diamond_square(size, roughness=0.7):
-            """EN: Diamond-square algorithm for procedural terrain generation
-               DE: Diamond-Square-Algorithmus für prozedurale Terraingenerierung"""
-            n = 2**size + 1  # Grid size must be 2^n + 1 / Gittergröße muss 2^n + 1 sein
-            terrain = np.zeros((n, n))
-            
-            # Initialize corners with random values / Ecken mit Zufallswerten initialisieren
-            terrain[0, 0] = np.random.randn()
-            terrain[0, -1] = np.random.randn()
-            terrain[-1, 0] = np.random.randn()
-            terrain[-1, -1] = np.random.randn()
-            
-            step_size = n - 1
-            scale = 1.0  # Noise amplitude / Rauschamplitude
-            
-            while step_size > 1:
-                half_step = step_size // 2
-                
-                # EN: Diamond step - average square corners and add randomness
-                # DE: Diamond-Schritt - Quadratecken mitteln und Zufälligkeit hinzufügen
-                for i in range(0, n-1, step_size):
-                    for j in range(0, n-1, step_size):
-                        avg = (terrain[i, j] + terrain[i, j+step_size] +
-                               terrain[i+step_size, j] + terrain[i+step_size, j+step_size]) / 4
-                        terrain[i+half_step, j+half_step] = avg + np.random.randn() * scale
-                
-                # Square step
-                for i in range(0, n, half_step):
-                    for j in range((i + half_step) % step_size, n, step_size):
-                        count = 0
-                        total = 0
-                        
-                        if i >= half_step:
-                            total += terrain[i-half_step, j]
-                            count += 1
-                        if i + half_step < n:
-                            total += terrain[i+half_step, j]
-                            count += 1
-                        if j >= half_step:
-                            total += terrain[i, j-half_step]
-                            count += 1
-                        if j + half_step < n:
-                            total += terrain[i, j+half_step]
-                            count += 1
-                        
-                        terrain[i, j] = total / count + np.random.randn() * scale
-                
-                step_size = half_step
-                scale *= roughness
-            
-            return terrain
-        
         # Generate terrain
         terrain = diamond_square(8, roughness=0.6)
         
         # Create mesh
-        x = np.linspace(0, 100, terrain.shape[0])
-        y = np.linspace(0, 100, terrain.shape[1])
+        x = np.linspace(0, 100, terrain.shape[0], dtype=DTYPE)
+        y = np.linspace(0, 100, terrain.shape[1], dtype=DTYPE)
         X, Y = np.meshgrid(x, y)
         
         # Scale height
@@ -409,10 +554,10 @@ class Professional3DGraphics:
         # Create surface
         grid = pv.StructuredGrid(X, Y, Z)
         
-        # Add elevation as scalar
-        grid['elevation'] = Z.flatten()
+        # Add elevation as scalar (Fortran order matches the structured point order)
+        grid['elevation'] = Z.ravel(order='F')
         
-        plotter = pv.Plotter(window_size=[1920, 1080])
+        plotter = self._get_plotter()
         
         # Add terrain with custom colormap
         plotter.add_mesh(
@@ -435,7 +580,7 @@ class Professional3DGraphics:
         plotter.camera_position = [(150, 150, 80), (50, 50, 0), (0, 0, 1)]
         plotter.enable_anti_aliasing('ssaa')
         
-        plotter.show(title="Fractal Landscape - Procedurally Generated Terrain")
+        self._show(plotter, "Fractal Landscape - Procedurally Generated Terrain", 'fractal_landscape.png')
 
 
 def main():
@@ -456,7 +601,7 @@ def main():
     print("4. Quantum Orbital Visualization")
     print("5. Interactive Neural Network")
     print("6. Fractal Landscape")
-    print("7. Run All Visualizations")
+    print("7. Run All Visualizations (off-screen, saved to ./output)")
     print()
     
     choice = input("Enter choice (1-7): ").strip()
@@ -471,6 +616,10 @@ def main():
     }
     
     if choice == '7':
+        # EN: Batch mode renders every scene off-screen instead of blocking on one window per scene
+        # DE: Der Batch-Modus rendert jede Szene off-screen, statt pro Szene auf ein Fenster zu warten
+        graphics.off_screen = True
+        print(f"Rendering all visualizations to ./{graphics.output_dir}/ ...\n")
         for viz in visualizations.values():
             viz()
             print("\n" + "="*70 + "\n")
@@ -480,6 +629,7 @@ def main():
         print("Invalid choice. Running Neural Network visualization as default...")
         graphics.create_interactive_neural_network()
     
+    graphics.close()
     print("\nVisualization complete!")
 
 